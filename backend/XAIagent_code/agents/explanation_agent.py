@@ -17,10 +17,11 @@ except ImportError:
 # Add parent directory to path for config import
 sys.path.append(str(Path(__file__).parent.parent))
 from config import OPENAI_API_KEY, OPENAI_MODEL, FEATURE_INFO
+from clients import get_openai_client
 
 # RAG imports
 try:
-    from knowledge_base.rag_service import RAGService
+    from knowledge_base.rag_service import get_rag_service
     RAG_AVAILABLE = True
 except ImportError:
     RAG_AVAILABLE = False
@@ -47,7 +48,7 @@ class ExplanationAgent:
         if not self.api_key:
             raise ValueError("OpenAI API key not provided")
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
         self.model = OPENAI_MODEL
 
         # Initialize RAG service
@@ -55,7 +56,7 @@ class ExplanationAgent:
         self.use_rag = use_rag and RAG_AVAILABLE
         if self.use_rag:
             try:
-                self.rag_service = RAGService(use_openai_embeddings=True)
+                self.rag_service = get_rag_service(use_openai_embeddings=True)
                 print("✓ Explanation Agent: RAG service initialized")
             except Exception as e:
                 print(f"Warning: Could not initialize RAG service: {e}")
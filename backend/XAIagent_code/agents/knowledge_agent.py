@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # OpenAI import
 try:
@@ -17,10 +18,11 @@ except ImportError:
 # Add parent directory to path for config import
 sys.path.append(str(Path(__file__).parent.parent))
 from config import OPENAI_API_KEY, OPENAI_MODEL, FEATURE_INFO
+from clients import get_openai_client
 
 # RAG and PubMed imports
 try:
-    from knowledge_base.rag_service import RAGService
+    from knowledge_base.rag_service import get_rag_service
     RAG_AVAILABLE = True
 except ImportError:
     RAG_AVAILABLE = False
@@ -33,6 +35,9 @@ except ImportError:
     PUBMED_AVAILABLE = False
     print("Warning: PubMed service not available")
 
+# Shared by all KnowledgeAgent instances for concurrent RAG/PubMed retrieval
+_RETRIEVAL_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="retrieval")
+
 
 class KnowledgeAgent:
     """
@@ -51,7 +56,7 @@ class KnowledgeAgent:
         if not self.api_key:
             raise ValueError("OpenAI API key not provided")
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
         self.model = OPENAI_MODEL
 
         # Initialize RAG service
@@ -59,7 +64,7 @@ class KnowledgeAgent:
         self.use_rag = use_rag and RAG_AVAILABLE
         if self.use_rag:
             try:
-                self.rag_service = RAGService(use_openai_embeddings=True)
+                self.rag_service = get_rag_service(use_openai_embeddings=True)
                 print("✓ Knowledge Agent: RAG service initialized")
             except Exception as e:
                 print(f"Warning: Could not initialize RAG service: {e}")
@@ -184,6 +189,74 @@ class KnowledgeAgent:
                 "needs_external_info": True
             }
 
+    def _retrieve_guidelines(self, question: str, search_params: Dict[str, Any]) -> tuple:
+        """
+        RAG retrieval for the question; returns (guideline_context, references)
+        """
+        guideline_context = ""
+        references = []
+        try:
+            query_text = search_params["rag_query"]
+            # Eğer query çok boşsa, orijinal soruyu kullan
+            if len(query_text) < 5: 
+                query_text = question
+                
+            print(f"DEBUG: Searching RAG with: {query_text}")
+            
+            rag_results = self.rag_service.retrieve(query_text, n_results=4)
+            
+            if rag_results:
+                guideline_context = "\n\n=== Retrieved Clinical Guidelines ===\n"
+                for i, result in enumerate(rag_results, 1):
+                    guideline_context += f"Source [{i}]: {result['source']} (Page {result['page']})\n"
+                    guideline_context += f"Content: {result['text'][:600]}...\n\n"
+                    references.append({
+                        'type': 'guideline',
+                        'source': result['source'],
+                        'page': result['page']
+                    })
+        except Exception as e:
+            print(f"Error retrieving from RAG: {e}")
+        return guideline_context, references
+
+    def _retrieve_pubmed(self, question: str, search_params: Dict[str, Any]) -> tuple:
+        """
+        PubMed search for the question; returns (pubmed_context, references)
+        """
+        pubmed_context = ""
+        references = []
+        try:
+            query_text = search_params["pubmed_query"]
+            # Eğer query çok boşsa veya GPT saçma bir şey döndüyse düzelt
+            if len(query_text) < 5 or "pubmed" in query_text.lower():
+                query_text = f"CML cardiovascular {question}"
+
+            print(f"DEBUG: Searching PubMed with: {query_text}")
+            
+            articles = self.pubmed_service.search_articles(
+                query=query_text,
+                max_results=3
+            )
+            if articles:
+                pubmed_context = "\n\n=== Retrieved PubMed Articles ===\n"
+                for article in articles:
+                    pubmed_context += f"Title: {article['title']}\n"
+                    pubmed_context += f"Journal: {article['journal']} ({article['year']})\n"
+                    pubmed_context += f"Abstract: {article['abstract'][:500]}...\n"
+                    pubmed_context += f"PMID: {article['pmid']}\n\n"
+                    references.append({
+                        'type': 'pubmed',
+                        'pmid': article['pmid'],
+                        'title': article['title'],
+                        'journal': article['journal'],
+                        'year': article['year']
+                    })
+            else:
+                print("DEBUG: No articles found in PubMed.")
+        except Exception as e:
+            print(f"Error searching PubMed: {e}")
+        return pubmed_context, references
+
     def answer_question(self, question: str, context: Dict[str, Any] = None) -> str:
         """
         Answer a general question about features, CML, or CVD.
@@ -219,64 +292,20 @@ class KnowledgeAgent:
         guideline_context = ""
         pubmed_context = ""
         references = []
-        
-        # --- RAG Retrieval ---
-        if use_rag_config and should_search and self.rag_service:
-            try:
-                query_text = search_params["rag_query"]
-                # Eğer query çok boşsa, orijinal soruyu kullan
-                if len(query_text) < 5: 
-                    query_text = question
-                    
-                print(f"DEBUG: Searching RAG with: {query_text}")
-                
-                rag_results = self.rag_service.retrieve(query_text, n_results=4)
-                
-                if rag_results:
-                    guideline_context = "\n\n=== Retrieved Clinical Guidelines ===\n"
-                    for i, result in enumerate(rag_results, 1):
-                        guideline_context += f"Source [{i}]: {result['source']} (Page {result['page']})\n"
-                        guideline_context += f"Content: {result['text'][:600]}...\n\n"
-                        references.append({
-                            'type': 'guideline',
-                            'source': result['source'],
-                            'page': result['page']
-                        })
-            except Exception as e:
-                print(f"Error retrieving from RAG: {e}")
 
-        # --- PubMed Retrieval ---
-        if use_pubmed_config and should_search and self.pubmed_service:
-            try:
-                query_text = search_params["pubmed_query"]
-                # Eğer query çok boşsa veya GPT saçma bir şey döndüyse düzelt
-                if len(query_text) < 5 or "pubmed" in query_text.lower():
-                    query_text = f"CML cardiovascular {question}"
-
-                print(f"DEBUG: Searching PubMed with: {query_text}")
-                
-                articles = self.pubmed_service.search_articles(
-                    query=query_text,
-                    max_results=3
-                )
-                if articles:
-                    pubmed_context = "\n\n=== Retrieved PubMed Articles ===\n"
-                    for article in articles:
-                        pubmed_context += f"Title: {article['title']}\n"
-                        pubmed_context += f"Journal: {article['journal']} ({article['year']})\n"
-                        pubmed_context += f"Abstract: {article['abstract'][:500]}...\n"
-                        pubmed_context += f"PMID: {article['pmid']}\n\n"
-                        references.append({
-                            'type': 'pubmed',
-                            'pmid': article['pmid'],
-                            'title': article['title'],
-                            'journal': article['journal'],
-                            'year': article['year']
-                        })
-                else:
-                    print("DEBUG: No articles found in PubMed.")
-            except Exception as e:
-                print(f"Error searching PubMed: {e}")
+        # --- RAG + PubMed Retrieval ---
+        # Both sources only wait on I/O (embeddings/Chroma vs. NCBI), so run them side by side
+        run_rag = use_rag_config and should_search and self.rag_service
+        run_pubmed = use_pubmed_config and should_search and self.pubmed_service
+        if run_rag and run_pubmed:
+            rag_future = _RETRIEVAL_POOL.submit(self._retrieve_guidelines, question, search_params)
+            pubmed_context, pubmed_refs = self._retrieve_pubmed(question, search_params)
+            guideline_context, rag_refs = rag_future.result()
+            references = rag_refs + pubmed_refs
+        elif run_rag:
+            guideline_context, references = self._retrieve_guidelines(question, search_params)
+        elif run_pubmed:
+            pubmed_context, references = self._retrieve_pubmed(question, search_params)
 
         # Build enhanced system prompt
         system_prompt = f"""You are a specialized medical knowledge assistant for CML and CVD risk.
@@ -2,9 +2,8 @@
 Prediction Agent - Handles model loading and CVD risk prediction
 """
 import joblib
-import pandas as pd
 import numpy as np
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Tuple
 from pathlib import Path
 import sys
 
@@ -22,6 +21,9 @@ class PredictionAgent:
         self.explainer = None
         self.scaler = None
         self.imputer = None
+        self.feature_names = None
+        self.scale_inv = None
+        self.scale_bias = None
         self.is_loaded = False
 
     def load_model(self) -> bool:
@@ -36,6 +38,11 @@ class PredictionAgent:
             self.explainer = joblib.load(MODEL_PATHS["explainer"])
             self.scaler = joblib.load(MODEL_PATHS["scaler"])
             self.imputer = joblib.load(MODEL_PATHS["imputer"])
+            # Column order the scaler/imputer/explainer were fit with
+            self.feature_names = list(self.scaler.feature_names_in_)
+            # StandardScaler folded into one multiply-add: (x - mean) / scale == x * scale_inv + scale_bias
+            self.scale_inv = 1.0 / self.scaler.scale_
+            self.scale_bias = -self.scaler.mean_ * self.scale_inv
             self.is_loaded = True
             print("Model loaded successfully!")
             return True
@@ -71,14 +78,30 @@ class PredictionAgent:
         Returns:
             Preprocessed data array
         """
-        # Convert to DataFrame
-        df = pd.DataFrame([patient_data])
+        return self.preprocess_batch([patient_data])
 
-        # Scale and impute
-        data_scaled = self.scaler.transform(df)
-        data_imputed = self.imputer.transform(data_scaled)
+    def preprocess_batch(self, patients: List[Dict[str, float]]) -> np.ndarray:
+        """
+        Preprocess several patients at once (scale and impute)
+
+        Args:
+            patients: List of patient feature dictionaries
 
-        return data_imputed
+        Returns:
+            Preprocessed data array, one row per patient
+        """
+        # Rows in model column order, straight into NumPy (no DataFrame per call)
+        data = np.array([[patient_data.get(f, np.nan) for f in self.feature_names]
+                         for patient_data in patients], dtype=np.float64)
+
+        # Scale (NaNs pass through), then impute in scaled space; KNNImputer leaves
+        # complete rows unchanged, so only rows with NaNs go through it
+        data_scaled = data * self.scale_inv + self.scale_bias
+        nan_rows = np.isnan(data_scaled).any(axis=1)
+        if nan_rows.any():
+            data_scaled[nan_rows] = self.imputer.transform(data_scaled[nan_rows])
+
+        return data_scaled
 
     def predict(self, patient_data: Dict[str, float]) -> Dict[str, Any]:
         """
@@ -94,25 +117,47 @@ class PredictionAgent:
                 - shap_values: Dictionary of SHAP values for each feature
                 - prediction: Binary prediction (0 or 1)
         """
+        return self.predict_batch([patient_data])[0]
+
+    def predict_batch(self, patients: List[Dict[str, float]]) -> List[Dict[str, Any]]:
+        """
+        Make CVD risk predictions for several patients with a single
+        preprocessing pass and a single SHAP call over the stacked rows
+
+        Args:
+            patients: List of patient feature dictionaries
+
+        Returns:
+            List of predict() result dictionaries, in the same order
+        """
         if not self.is_loaded:
             raise RuntimeError("Model not loaded. Call load_model() first.")
 
         # Validate data
-        is_valid, error_msg = self.validate_patient_data(patient_data)
-        if not is_valid:
-            raise ValueError(error_msg)
+        for patient_data in patients:
+            is_valid, error_msg = self.validate_patient_data(patient_data)
+            if not is_valid:
+                raise ValueError(error_msg)
 
         # Preprocess
-        data_processed = self.preprocess_data(patient_data)
+        data_processed = self.preprocess_batch(patients)
 
-        # Get SHAP explanation
-        explanation = self.explainer(data_processed)
+        # Get SHAP values for the whole batch in one call; the explainer is exact
+        # TreeSHAP, so the extra additivity re-prediction is skipped
+        shap_matrix = self.explainer.shap_values(data_processed, check_additivity=False)
 
         # Get prediction probability
         # The explainer contains the model, extract predictions
         base_value = self.explainer.expected_value[1]  # Base value for class 1 (CVD)
-        shap_values = explanation.values[0][:, 1]  # SHAP values for class 1
 
+        return [self._build_result(patient_data, row_values[:, 1], base_value)  # SHAP values for class 1
+                for patient_data, row_values in zip(patients, shap_matrix)]
+
+    def _build_result(self, patient_data: Dict[str, float], shap_values: np.ndarray,
+                      base_value: float) -> Dict[str, Any]:
+        """
+        Turn one patient's SHAP values into the predict() result dictionary
+        """
         # Calculate risk score (probability)
         # Using SHAP: prediction = base_value + sum(shap_values)
         # Then apply sigmoid to get probability
@@ -128,8 +173,7 @@ class PredictionAgent:
             risk_level = "High"
 
         # Create SHAP values dictionary
-        feature_names = list(patient_data.keys())
-        shap_dict = dict(zip(feature_names, shap_values))
+        shap_dict = dict(zip(self.feature_names, shap_values))
 
         # Sort SHAP values by absolute value (most important features)
         sorted_shap = dict(sorted(shap_dict.items(),
@@ -9,6 +9,7 @@ import plotly.graph_objects as go
 import plotly.express as px
 from pathlib import Path
 import sys
+import traceback
 import os
 
 # Add current directory to path
@@ -308,10 +309,11 @@ else:
 
                         if top_risks:
                             # Create DataFrame for visualization
-                            risk_df = pd.DataFrame([
-                                {'Feature': k, 'SHAP Value': v, 'Patient Value': patient_data.get(k, 0)}
-                                for k, v in top_risks.items()
-                            ])
+                            risk_df = pd.DataFrame({
+                                'Feature': list(top_risks),
+                                'SHAP Value': list(top_risks.values()),
+                                'Patient Value': [patient_data.get(k, 0) for k in top_risks]
+                            })
 
                             # Bar chart
                             fig = px.bar(
@@ -335,10 +337,11 @@ else:
 
                         if protective:
                             # Create DataFrame for visualization
-                            protect_df = pd.DataFrame([
-                                {'Feature': k, 'SHAP Value': abs(v), 'Patient Value': patient_data.get(k, 0)}
-                                for k, v in protective.items()
-                            ])
+                            protect_df = pd.DataFrame({
+                                'Feature': list(protective),
+                                'SHAP Value': [abs(v) for v in protective.values()],
+                                'Patient Value': [patient_data.get(k, 0) for k in protective]
+                            })
 
                             # Bar chart
                             fig = px.bar(
@@ -365,7 +368,6 @@ else:
 
                 except Exception as e:
                     st.error(f"Analysis failed: {e}")
-                    import traceback
                     st.code(traceback.format_exc())
 
     # Page: Scenario Comparison
@@ -0,0 +1,14 @@
+"""
+Shared API clients for the XAI Agent System
+"""
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: str):
+    """
+    One OpenAI client per API key, so every agent (and the RAG embeddings)
+    reuses the same HTTP connection pool instead of opening its own.
+    """
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
@@ -12,7 +12,7 @@ DATA_DIR = BASE_DIR.parent / "models"  # Keep for compatibility
 
 # Model files
 MODEL_PATHS = {
-    "explainer": MODEL_DIR / "RF_explainer_allCVD.bz2",
+    "explainer": MODEL_DIR / "RF_explainer_allCVD.z",
     "scaler": MODEL_DIR / "RF_scaler_allCVD.pkl",
     "imputer": MODEL_DIR / "RF_imputer_allCVD.pkl"
 }
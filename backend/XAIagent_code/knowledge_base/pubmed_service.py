@@ -7,6 +7,14 @@ import xml.etree.ElementTree as ET
 from typing import List, Dict, Any, Optional
 import time
 
+# Faster JSON decoding for ESearch responses (optional)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
+
 class PubMedService:
     """
     Lightweight PubMed Service using direct NCBI E-utilities API.
@@ -41,8 +49,11 @@ class PubMedService:
             }
             
             resp = self.session.get(f"{self.BASE_URL}/esearch.fcgi", params=search_params, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
+            # NCBI rate limits (429) are routine; report them without building an exception
+            if resp.status_code >= 400:
+                print(f"PubMed API Error: HTTP {resp.status_code} from esearch")
+                return []
+            data = json_loads(resp.content)
             
             id_list = data.get("esearchresult", {}).get("idlist", [])
             
@@ -59,7 +70,9 @@ class PubMedService:
             
             # Fetch XML content
             fetch_resp = self.session.get(f"{self.BASE_URL}/efetch.fcgi", params=fetch_params, timeout=15)
-            fetch_resp.raise_for_status()
+            if fetch_resp.status_code >= 400:
+                print(f"PubMed API Error: HTTP {fetch_resp.status_code} from efetch")
+                return []
             
             # 3. Parse XML manually (More robust than BioPython for Abstracts)
             return self._parse_pubmed_xml(fetch_resp.content)
@@ -6,6 +6,7 @@ import os
 import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+from functools import lru_cache
 import hashlib
 
 # PDF Processing
@@ -46,6 +47,7 @@ except ImportError:
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 from config import OPENAI_API_KEY
+from clients import get_openai_client
 
 class RAGService:
     """
@@ -68,7 +70,7 @@ class RAGService:
         
         # Initialize embeddings
         if use_openai_embeddings and OPENAI_AVAILABLE and OPENAI_API_KEY:
-            self.embedding_client = OpenAI(api_key=OPENAI_API_KEY)
+            self.embedding_client = get_openai_client(OPENAI_API_KEY)
             self.embedding_model = "text-embedding-3-small"
             print("✓ Using OpenAI embeddings")
         elif SENTENCE_TRANSFORMERS_AVAILABLE:
@@ -336,6 +338,16 @@ class RAGService:
         except Exception as e:
             print(f"Error clearing collection: {e}")
 
+
+@lru_cache(maxsize=None)
+def get_rag_service(use_openai_embeddings: bool = True,
+                    collection_name: str = "clinical_guidelines") -> RAGService:
+    """
+    Shared RAGService per configuration, so the agents query one Chroma
+    client and embedding model instead of each loading their own.
+    """
+    return RAGService(use_openai_embeddings=use_openai_embeddings, collection_name=collection_name)
+
 if __name__ == "__main__":
     # Testing Code
     if not os.getenv("OPENAI_API_KEY"):
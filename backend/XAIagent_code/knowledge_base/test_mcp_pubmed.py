@@ -3,6 +3,7 @@ Test script for PubMed MCP integration
 Tests MCP client and server functionality
 """
 import sys
+import traceback
 from pathlib import Path
 
 # Add parent directory to path
@@ -61,7 +62,6 @@ def test_mcp_client():
         return False
     except Exception as e:
         print(f"✗ Error: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -99,7 +99,6 @@ def test_pubmed_service_with_mcp():
         
     except Exception as e:
         print(f"✗ Error: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -227,8 +227,7 @@ class CVDAgentOrchestrator:
     def compare_scenarios(self, scenario1_data: Dict[str, float], scenario2_data: Dict[str, float],
                          label1: str = "Current", label2: str = "Proposed") -> Dict[str, Any]:
         """Compare two scenarios"""
-        pred1 = self.prediction_agent.predict(scenario1_data)
-        pred2 = self.prediction_agent.predict(scenario2_data)
+        pred1, pred2 = self.prediction_agent.predict_batch([scenario1_data, scenario2_data])
         
         risk_change = pred2["risk_score"] - pred1["risk_score"]
         risk_change_pct = (risk_change / pred1["risk_score"]) * 100 if pred1["risk_score"] != 0 else 0
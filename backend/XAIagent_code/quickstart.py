@@ -6,11 +6,14 @@ with a simple, guided demo.
 """
 import os
 import sys
+import logging
 from pathlib import Path
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+logger = logging.getLogger(__name__)
+
 
 def print_section(title):
     """Print a formatted section header"""
@@ -94,8 +97,7 @@ def demo_prediction_only():
 
     except Exception as e:
         print(f"✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Demo failed")
         return False
 
 
@@ -167,8 +169,7 @@ def demo_full_system():
 
     except Exception as e:
         print(f"✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Demo failed")
         return False
 
 
@@ -233,8 +234,7 @@ def demo_what_if():
 
     except Exception as e:
         print(f"✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Demo failed")
         return False
 
 
@@ -300,4 +300,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
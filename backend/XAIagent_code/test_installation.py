@@ -5,6 +5,7 @@ This script tests that all components are properly installed and can load.
 Run this after installing requirements to verify your setup.
 """
 import sys
+import traceback
 from pathlib import Path
 
 print("="*60)
@@ -40,7 +41,7 @@ print("\n3. Checking model files...")
 model_dir = Path(__file__).parent.parent / "CML_CVD_Model" / "Models"
 
 required_files = [
-    "RF_explainer_allCVD.bz2",
+    "RF_explainer_allCVD.z",
     "RF_scaler_allCVD.pkl",
     "RF_imputer_allCVD.pkl"
 ]
@@ -82,7 +83,6 @@ try:
 
 except ImportError as e:
     print(f"   ✗ Import failed: {e}")
-    import traceback
     traceback.print_exc()
     sys.exit(1)
 
@@ -98,7 +98,6 @@ try:
         sys.exit(1)
 except Exception as e:
     print(f"   ✗ Error loading model: {e}")
-    import traceback
     traceback.print_exc()
     sys.exit(1)
 
@@ -141,7 +140,6 @@ try:
 
 except Exception as e:
     print(f"   ✗ Prediction failed: {e}")
-    import traceback
     traceback.print_exc()
     sys.exit(1)
 
@@ -1,15 +1,32 @@
+import os
+
+# TreeSHAP runs on Numba's own thread pool (size it with NUMBA_NUM_THREADS);
+# keep the BLAS/OpenMP pools single-threaded so they don't oversubscribe the cores
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+
 import joblib
 import pandas as pd
 import numpy as np
 import shap
-from flask import Flask, request, jsonify
+import orjson
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
-import os
+from flask_compress import Compress
 import io
+import re
+import hashlib
+import queue
+import threading
 import time
 import random
 import sys
 from pathlib import Path
+from functools import lru_cache
+from collections import OrderedDict
+
+from tree_shap import ForestShap, scale_rows
+from knn_impute import KNNFill
 
 # Load environment variables
 try:
@@ -38,17 +55,16 @@ except ImportError as e:
 
 app = Flask(__name__)
 CORS(app)
+# shap_html embeds the whole SHAP JS bundle, so /api/predict bodies compress very well
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_LEVEL'] = 4
+Compress(app)
 
 xai_orchestrator = None
+_orchestrator_lock = threading.Lock()
 MODEL_DIR = os.path.join(os.path.dirname(__file__), 'models')
 
-try:
-    loaded_explainer = joblib.load(os.path.join(MODEL_DIR, "RF_explainer_allCVD.bz2"))
-    loaded_imputer = joblib.load(os.path.join(MODEL_DIR, "RF_imputer_allCVD.pkl"))
-    loaded_scaler = joblib.load(os.path.join(MODEL_DIR, "RF_scaler_allCVD.pkl"))
-except FileNotFoundError:
-    print("CRITICAL ERROR: Model files not found.")
-
 FEATURE_ORDER = [
     "anchor_age", "White Blood Cells", "Urea Nitrogen", "Neutrophils", "BMI",
     "Monocytes", "Glucose", "systolic", "MCH", "Calcium, Total", "Lymphocytes",
@@ -56,6 +72,54 @@ FEATURE_ORDER = [
     "gender_encoded", "nilotinib_dose", "ponatinib_dose", "ruxolitinib_dose"
 ]
 
+try:
+    loaded_explainer = joblib.load(os.path.join(MODEL_DIR, "RF_explainer_allCVD.z"))
+    loaded_imputer = joblib.load(os.path.join(MODEL_DIR, "RF_imputer_allCVD.pkl"))
+    loaded_scaler = joblib.load(os.path.join(MODEL_DIR, "RF_scaler_allCVD.pkl"))
+    # Numba TreeSHAP over the explainer's forest arrays. Compiled here on the main
+    # thread: the parallel kernel's thread pool must not be first started from a worker
+    forest_shap = ForestShap(loaded_explainer, n_features=len(FEATURE_ORDER))
+    forest_shap.warmup()
+    # StandardScaler folded into one multiply-add: (x - mean) / scale == x * SCALE_INV + SCALE_BIAS
+    SCALE_INV = 1.0 / loaded_scaler.scale_
+    SCALE_BIAS = -loaded_scaler.mean_ * SCALE_INV
+    # KNNImputer.transform (fit in scaled space) without sklearn's per-call validation/training-side recompute
+    knn_fill = KNNFill(loaded_imputer)
+except FileNotFoundError:
+    print("CRITICAL ERROR: Model files not found.")
+
+# Set FUSED_PREPROCESS=0 to run the plain sklearn imputer/scaler path (for validation)
+FUSED_PREPROCESS = os.getenv("FUSED_PREPROCESS", "1") == "1"
+# Set SHAP_APPROXIMATE=1 to serve path (Saabas) attributions instead of exact TreeSHAP
+SHAP_APPROXIMATE = os.getenv("SHAP_APPROXIMATE", "0") == "1"
+
+def _model_fingerprint() -> str:
+    """Hash of the model artifacts and result-changing flags, mixed into /api/predict ETags."""
+    h = hashlib.sha1(f"fused={FUSED_PREPROCESS};approx={SHAP_APPROXIMATE}".encode())
+    for name in ("RF_explainer_allCVD.z", "RF_imputer_allCVD.pkl", "RF_scaler_allCVD.pkl"):
+        try:
+            with open(os.path.join(MODEL_DIR, name), "rb") as f:
+                h.update(f.read())
+        except FileNotFoundError:
+            h.update(b"missing:" + name.encode())
+    return h.hexdigest()
+
+# A new model or mode must not revalidate bodies computed by the old one
+MODEL_FINGERPRINT = _model_fingerprint()
+
+# Micro-batching: concurrent /api/predict rows share one model call
+MAX_BATCH = 16
+MAX_WAIT_MS = 10
+_batch_queue = queue.Queue()
+
+# Chat answers keyed by (message, orchestrator context); repeats skip the LLM round-trip.
+# Entries expire after CHAT_CACHE_TTL seconds: retrieval failures (PubMed rate limits,
+# RAG errors) are swallowed by the agents, so a source-less answer must not stick forever
+CHAT_CACHE_SIZE = int(os.getenv("CHAT_CACHE_SIZE", "256"))
+CHAT_CACHE_TTL = float(os.getenv("CHAT_CACHE_TTL", "600"))
+_chat_cache = OrderedDict()
+_chat_cache_lock = threading.Lock()
+
 # --- Helper Functions ---
 
 def parse_risk_score(score_input):
@@ -85,67 +149,212 @@ def parse_risk_score(score_input):
         print(f"Risk parse error for '{score_input}': {e}")
         return 0.0
 
+def _json_response(payload: dict, headers: dict = None) -> Response:
+    """Serializes with orjson, which writes NumPy arrays and scalars without tolist()/float()."""
+    return Response(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+                    headers=headers, mimetype='application/json')
+
+def _chat_cache_key(message: str, context: dict) -> str:
+    return hashlib.sha1(orjson.dumps([message, context], option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+def _chat_cache_get(key: str):
+    with _chat_cache_lock:
+        entry = _chat_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, text = entry
+        if time.monotonic() >= expires_at:
+            del _chat_cache[key]
+            return None
+        _chat_cache.move_to_end(key)
+        return text
+
+def _chat_cache_put(key: str, text: str):
+    # Agents report failures as "Error ..." strings; don't pin those
+    if not CHAT_CACHE_SIZE or CHAT_CACHE_TTL <= 0 or not isinstance(text, str) or text.startswith("Error"):
+        return
+    with _chat_cache_lock:
+        _chat_cache[key] = (time.monotonic() + CHAT_CACHE_TTL, text)
+        _chat_cache.move_to_end(key)
+        if len(_chat_cache) > CHAT_CACHE_SIZE:
+            _chat_cache.popitem(last=False)
+
+def _json_request() -> dict:
+    """Parses the request body with orjson instead of Flask's stdlib-json get_json()."""
+    return orjson.loads(request.get_data(cache=False))
+
+def _preprocess(input_array: np.ndarray) -> tuple:
+    """
+    Scales and imputes raw (N, 21) float rows, returns (imputed, scaled).
+    Same order as training: the KNNImputer was fit on standardized features,
+    so rows are scaled first (the compiled x * SCALE_INV + SCALE_BIAS, NaNs
+    pass through) and only rows with NaNs are imputed in scaled space by KNNFill.
+    `imputed` is the raw input with just the filled cells mapped back to
+    original units, for display.
+    """
+    if not FUSED_PREPROCESS:
+        scaled_array = loaded_imputer.transform(loaded_scaler.transform(pd.DataFrame(input_array, columns=FEATURE_ORDER)))
+        return loaded_scaler.inverse_transform(scaled_array), scaled_array
+
+    scaled_array = np.empty_like(input_array)
+    if not scale_rows(input_array, SCALE_INV, SCALE_BIAS, scaled_array):
+        return input_array, scaled_array
+
+    nan_mask = np.isnan(input_array)
+
+    nan_rows = nan_mask.any(axis=1)
+    scaled_array[nan_rows] = knn_fill.transform(scaled_array[nan_rows])
+    imputed_array = input_array.copy()
+    rows, cols = np.nonzero(nan_mask)
+    imputed_array[rows, cols] = scaled_array[rows, cols] * loaded_scaler.scale_[cols] + loaded_scaler.mean_[cols]
+    return imputed_array, scaled_array
+
+def _transform_batch(rows: list) -> tuple:
+    """Imputer, scaler and TreeSHAP on a stacked (N, 21) batch of raw feature rows."""
+    imputed_array, scaled_array = _preprocess(np.array(rows, dtype=np.float64))
+    return imputed_array, forest_shap.shap_values(scaled_array, approximate=SHAP_APPROXIMATE)
+
+def _batch_worker():
+    """
+    Drains _batch_queue: waits up to MAX_WAIT_MS for up to MAX_BATCH rows,
+    runs them through the model in one call and wakes each waiting request.
+    """
+    while True:
+        items = [_batch_queue.get()]
+        deadline = time.monotonic() + MAX_WAIT_MS / 1000.0
+        while len(items) < MAX_BATCH:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                items.append(_batch_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        try:
+            imputed, shap_matrix = _transform_batch([features for features, _, _ in items])
+            for i, (_, _, box) in enumerate(items):
+                box["imputed"], box["shap"] = imputed[i], shap_matrix[i]
+        except Exception:
+            # One bad row must not fail its neighbours: retry them one by one
+            for features, _, box in items:
+                try:
+                    imputed, shap_matrix = _transform_batch([features])
+                    box["imputed"], box["shap"] = imputed[0], shap_matrix[0]
+                except Exception as e:
+                    box["error"] = e
+        for _, event, _ in items:
+            event.set()
+
+def _explain_row(feature_tuple: tuple) -> tuple:
+    """Queues one row for the batch worker and blocks until it is processed."""
+    event = threading.Event()
+    box = {}
+    _batch_queue.put((feature_tuple, event, box))
+    event.wait()
+    if "error" in box:
+        raise box["error"]
+    return box["imputed"], box["shap"]
+
+@lru_cache(maxsize=512)
+def _compute_prediction(feature_tuple: tuple) -> dict:
+    """
+    Runs imputer, scaler, TreeSHAP and the force plot for one input.
+    Keyed by the raw feature tuple (FEATURE_ORDER), so repeated submissions
+    of the same patient reuse the result including the rendered HTML.
+    """
+    imputed_row, shap_values = _explain_row(feature_tuple)
+    base_value = forest_shap.base_value
+    prediction_probability = base_value + shap_values.sum()
+
+    f = io.StringIO()
+    shap.save_html(f, shap.force_plot(base_value, shap_values, features=imputed_row, feature_names=FEATURE_ORDER,
+                                      show=False, matplotlib=False))
+
+    return {
+        "status": "success",
+        "prediction": prediction_probability,
+        "base_value": base_value,
+        "shap_values": shap_values,
+        "feature_names": FEATURE_ORDER,
+        "feature_values": imputed_row,
+        "shap_html": f.getvalue()
+    }
+
 def get_orchestrator():
     global xai_orchestrator
     if xai_orchestrator is None and XAI_AGENT_AVAILABLE:
-        try:
-            api_key = os.getenv("OPENAI_API_KEY")
-            xai_orchestrator = CVDAgentOrchestrator(openai_api_key=api_key, use_rag=True, use_pubmed=True)
-            print("✓ XAI Orchestrator initialized")
-        except Exception as e:
-            print(f"Error initializing Orchestrator: {e}")
-            return None
+        # Concurrent first chats (threaded server) build the orchestrator only once
+        with _orchestrator_lock:
+            if xai_orchestrator is None:
+                try:
+                    api_key = os.getenv("OPENAI_API_KEY")
+                    xai_orchestrator = CVDAgentOrchestrator(openai_api_key=api_key, use_rag=True, use_pubmed=True)
+                    print("✓ XAI Orchestrator initialized")
+                except Exception as e:
+                    print(f"Error initializing Orchestrator: {e}")
+                    return None
     return xai_orchestrator
 
-def analyze_message_intent(message: str) -> str:
-    msg = message.lower()
+# Intent keyword tables, compiled once: one regex scan per branch instead of a Python loop of `in` checks
+# (plain alternation, so matching stays substring-based like before)
+INTENT_PATTERNS = (
     # 1. Araştırma / Dış Kaynak
-    if any(kw in msg for kw in ['pubmed', 'search', 'find', 'literature', 'article', 'study', 'journal', 'guideline']):
-        return 'knowledge'
-    # 2. Karşılaştırma
-    if any(kw in msg for kw in ['compare', 'difference', 'versus', 'vs', 'between', 'change', 'better', 'worse']):
-        return 'knowledge' # Genellikle knowledge veya explanation bakar, ama compare için explanation'a yönlendireceğiz aşağıda
+    ('knowledge', re.compile('pubmed|search|find|literature|article|study|journal|guideline')),
+    # 2. Karşılaştırma (Genellikle knowledge veya explanation bakar, ama compare için explanation'a yönlendireceğiz aşağıda)
+    ('knowledge', re.compile('compare|difference|versus|vs|between|change|better|worse')),
     # 3. Açıklama
-    if any(kw in msg for kw in ['explain', 'why', 'how', 'meaning', 'interpret', 'contribution', 'shap']):
-        return 'explanation'
+    ('explanation', re.compile('explain|why|how|meaning|interpret|contribution|shap')),
     # 4. Müdahale
-    if any(kw in msg for kw in ['recommend', 'suggest', 'plan', 'advice', 'treatment', 'manage']):
-        return 'intervention'
-    
+    ('intervention', re.compile('recommend|suggest|plan|advice|treatment|manage')),
+)
+
+def analyze_message_intent(message: str) -> str:
+    msg = message.lower()
+    for intent, pattern in INTENT_PATTERNS:
+        if pattern.search(msg):
+            return intent
     return 'knowledge'
 
+def _warmup():
+    """
+    Pushes one synthetic row through the remaining request-time paths
+    (KNN imputation, TreeSHAP, force plot) so the first real request starts warm.
+    The row goes through the batch worker like a request: that thread is the only
+    caller of the parallel kernel, which Numba's workqueue layer can't run concurrently.
+    """
+    try:
+        dummy = (None,) + (0.0,) * (len(FEATURE_ORDER) - 1)
+        imputed_row, shap_values = _explain_row(dummy)
+        shap.save_html(io.StringIO(), shap.force_plot(forest_shap.base_value, shap_values, features=imputed_row,
+                                                      feature_names=FEATURE_ORDER, show=False, matplotlib=False))
+        print("✓ Model warmup complete")
+    except Exception as e:
+        print(f"Warmup Error: {e}")
+
+threading.Thread(target=_batch_worker, name="predict-batcher", daemon=True).start()
+# Set WARMUP=0 to skip; runs in the background so startup is not delayed
+if os.getenv("WARMUP", "1") == "1":
+    threading.Thread(target=_warmup, name="model-warmup", daemon=True).start()
+
 # --- Endpoints ---
 
 @app.route('/api/predict', methods=['POST'])
 def predict():
     try:
-        time.sleep(random.uniform(1.0, 2.0))
-        input_json = request.get_json()
-        input_data_list = [input_json.get(f) for f in FEATURE_ORDER]
-        input_df = pd.DataFrame([input_data_list], columns=FEATURE_ORDER)
-
-        imputed_array = loaded_imputer.transform(input_df.values)
-        imputed_df = pd.DataFrame(imputed_array, columns=FEATURE_ORDER)
-        scaled_array = loaded_scaler.transform(imputed_df)
-        scaled_df = pd.DataFrame(scaled_array, columns=FEATURE_ORDER)
+        input_json = _json_request()
+        feature_tuple = tuple(input_json.get(f) for f in FEATURE_ORDER)
 
-        explanation = loaded_explainer(scaled_df)
-        shap_values = explanation.values[0, :, 1]
-        base_value = explanation.base_values[0, 1]
-        prediction_probability = base_value + shap_values.sum()
+        # Same input + same model/config -> same result, so the client can revalidate with If-None-Match
+        etag = hashlib.sha1(f"{MODEL_FINGERPRINT}:{feature_tuple!r}".encode()).hexdigest()
+        cache_headers = {"ETag": f'"{etag}"', "Cache-Control": "private, no-cache"}
+        # Flask-Compress tags encoded bodies as "<etag>:br" / "<etag>:gzip"
+        if any(tag.split(":")[0] == etag for tag in request.if_none_match):
+            return "", 304, cache_headers
 
-        f = io.StringIO()
-        shap.save_html(f, shap.force_plot(base_value, shap_values, features=imputed_df.iloc[0], show=False, matplotlib=False))
-        
-        return jsonify({
-            "status": "success",
-            "prediction": float(prediction_probability),
-            "base_value": float(base_value),
-            "shap_values": shap_values.tolist(),     
-            "feature_names": FEATURE_ORDER,          
-            "feature_values": imputed_df.iloc[0].values.tolist(),        
-            "shap_html": f.getvalue()
-        })
+        time.sleep(random.uniform(1.0, 2.0))
+        result = _compute_prediction(feature_tuple)
+        return _json_response(result, headers=cache_headers)
     except Exception as e:
         print(f"Prediction Error: {e}")
         return jsonify({"status": "error", "message": str(e)}), 500
@@ -153,76 +362,125 @@ def predict():
 @app.route('/api/predict-simple', methods=['POST'])
 def predict_simple():
     try:
-        input_json = request.get_json()
+        input_json = _json_request()
         input_data_list = [input_json.get(f) for f in FEATURE_ORDER]
-        imputed_array = loaded_imputer.transform(pd.DataFrame([input_data_list], columns=FEATURE_ORDER).values)
-        scaled_array = loaded_scaler.transform(pd.DataFrame(imputed_array, columns=FEATURE_ORDER))
-        explanation = loaded_explainer(pd.DataFrame(scaled_array, columns=FEATURE_ORDER))
-        prediction_probability = explanation.base_values[0, 1] + explanation.values[0, :, 1].sum()
-        return jsonify({"status": "success", "prediction": float(prediction_probability)})
+        _, scaled_array = _preprocess(np.array([input_data_list], dtype=np.float64))
+        # No SHAP needed here: sum the reached leaf values directly
+        prediction_probability = forest_shap.predict(scaled_array)[0]
+        return _json_response({"status": "success", "prediction": prediction_probability})
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
+def _orchestrator_context(frontend_context: dict) -> dict:
+    """Frontend chat context (buttons, risk, SHAP, patient data) -> orchestrator context_data"""
+    # 1. Frontend Buton Durumlarını Doğrudan Al
+    # "varsayılan True olsun" veya "False olsun" demiyoruz.
+    # Frontend ne yolladıysa onu alıyoruz. (.get ikinci parametresi None olursa diye önlem amaçlı False)
+    use_pubmed_from_frontend = frontend_context.get('usePubmedSources', False)
+    use_guidelines_from_frontend = frontend_context.get('useGuidelineSources', True)
+
+    # NOT: Daha önce burada olan "if 'pubmed' in message: use_pubmed = True" 
+    # satırlarını SİLDİK. Artık patron Frontend butonu.
+
+    # 2. Context Hazırla (Risk ve SHAP verileri)
+    risk_val = parse_risk_score(frontend_context.get('riskScore'))
+    
+    raw_shap = frontend_context.get('shapValues', {})
+    shap_dict = {}
+    if isinstance(raw_shap, list):
+        for item in raw_shap:
+            shap_dict[item.get('name', '')] = float(item.get('shap', 0))
+    elif isinstance(raw_shap, dict):
+        shap_dict = {k: float(v) for k, v in raw_shap.items()}
+
+    prediction_context = {
+        "risk_score": risk_val,
+        "risk_level": "High" if risk_val > 0.7 else ("Moderate" if risk_val > 0.3 else "Low"),
+        "feature_values": frontend_context.get('patientData', {}),
+        "shap_values": shap_dict
+    }
+
+    # 3. Veriyi Orchestrator'a Paketle
+    return {
+        "patient_data": frontend_context.get('patientData', {}),
+        "prediction": prediction_context,
+        "updated_scenarios": [],
+        # Frontend'den gelen buton bilgisini aynen iletiyoruz:
+        "use_pubmed": use_pubmed_from_frontend,         
+        "use_guidelines": use_guidelines_from_frontend   
+    }
+
+def _route_messages(orchestrator, messages: list, orchestrator_context: dict) -> list:
+    """
+    Answers each message in order through the orchestrator, serving repeats
+    (same message + context) from the chat cache.
+    """
+    responses = []
+    for user_message in messages:
+        cache_key = _chat_cache_key(user_message, orchestrator_context)
+        response_text = _chat_cache_get(cache_key)
+        if response_text is None:
+            response_text = orchestrator.route_request(user_message, orchestrator_context)
+            _chat_cache_put(cache_key, response_text)
+        responses.append(response_text)
+    return responses
+
 @app.route('/api/chat', methods=['POST'])
 def chat():
     try:
-        data = request.get_json()
+        data = _json_request()
         user_message = data.get('message', '')
         frontend_context = data.get('context', {})
         
         orchestrator = get_orchestrator()
         
         if orchestrator and XAI_AGENT_AVAILABLE:
-            # --- DEĞİŞİKLİK BURADA BAŞLIYOR ---
-            
-            # 1. Frontend Buton Durumlarını Doğrudan Al
-            # "varsayılan True olsun" veya "False olsun" demiyoruz.
-            # Frontend ne yolladıysa onu alıyoruz. (.get ikinci parametresi None olursa diye önlem amaçlı False)
-            use_pubmed_from_frontend = frontend_context.get('usePubmedSources', False)
-            use_guidelines_from_frontend = frontend_context.get('useGuidelineSources', True)
+            # Client warmup: the orchestrator and its OpenAI/RAG clients are now built, skip the LLM
+            if user_message.strip().lower() == "ping":
+                return _json_response({"status": "success", "response": "pong"})
 
-            # NOT: Daha önce burada olan "if 'pubmed' in message: use_pubmed = True" 
-            # satırlarını SİLDİK. Artık patron Frontend butonu.
+            orchestrator_context = _orchestrator_context(frontend_context)
 
-            # 2. Context Hazırla (Risk ve SHAP verileri)
-            risk_val = parse_risk_score(frontend_context.get('riskScore'))
-            
-            raw_shap = frontend_context.get('shapValues', {})
-            shap_dict = {}
-            if isinstance(raw_shap, list):
-                for item in raw_shap:
-                    shap_dict[item.get('name', '')] = float(item.get('shap', 0))
-            elif isinstance(raw_shap, dict):
-                shap_dict = {k: float(v) for k, v in raw_shap.items()}
-
-            prediction_context = {
-                "risk_score": risk_val,
-                "risk_level": "High" if risk_val > 0.7 else ("Moderate" if risk_val > 0.3 else "Low"),
-                "feature_values": frontend_context.get('patientData', {}),
-                "shap_values": shap_dict
-            }
-
-            # 3. Veriyi Orchestrator'a Paketle
-            orchestrator_context = {
-                "patient_data": frontend_context.get('patientData', {}),
-                "prediction": prediction_context,
-                "updated_scenarios": [],
-                # Frontend'den gelen buton bilgisini aynen iletiyoruz:
-                "use_pubmed": use_pubmed_from_frontend,         
-                "use_guidelines": use_guidelines_from_frontend   
-            }
-
-            # 4. Yönlendirme (Orchestrator'ı çağır)
-            response_text = orchestrator.route_request(user_message, orchestrator_context)
+            # 4. Yönlendirme (Orchestrator'ı çağır) - aynı soru + context daha önce cevaplandıysa cache'ten dön
+            responses = _route_messages(orchestrator, [user_message], orchestrator_context)
 
-            return jsonify({"status": "success", "response": response_text})
+            return _json_response({"status": "success", "response": responses[0]})
 
         else:
-            return jsonify({"status": "success", "response": "System unavailable."})
+            return _json_response({"status": "success", "response": "System unavailable."})
 
     except Exception as e:
         print(f"Chat Error: {e}")
         return jsonify({"status": "error", "message": str(e)}), 500
 
+@app.route('/api/chat/batch', methods=['POST'])
+def chat_batch():
+    """
+    Several questions against one shared context: {"messages": [...], "context": {...}}.
+    They are answered in order within one request, so the orchestrator
+    and its context are set up once for the whole batch.
+    """
+    try:
+        data = _json_request()
+        messages = data.get('messages', [])
+        frontend_context = data.get('context', {})
+
+        if not isinstance(messages, list) or not all(isinstance(m, str) for m in messages):
+            return jsonify({"status": "error", "message": "'messages' must be a list of strings"}), 400
+
+        orchestrator = get_orchestrator()
+
+        if orchestrator and XAI_AGENT_AVAILABLE:
+            orchestrator_context = _orchestrator_context(frontend_context)
+            responses = _route_messages(orchestrator, messages, orchestrator_context)
+            return _json_response({"status": "success", "responses": responses})
+
+        else:
+            return _json_response({"status": "success", "responses": ["System unavailable."] * len(messages)})
+
+    except Exception as e:
+        print(f"Chat Batch Error: {e}")
+        return jsonify({"status": "error", "message": str(e)}), 500
+
 if __name__ == '__main__':
     app.run(host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""
+NumPy replay of the fitted KNNImputer.transform for online requests.
+
+sklearn re-validates the input and rebuilds the training-side terms of the
+nan-euclidean distance on every call, which dominates the cost for the
+handful of rows a request carries. Everything that depends only on the
+training set is computed once here; the per-row work is the same distance
+formula, donor selection and weighting as sklearn, so results match it.
+"""
+import numpy as np
+
+
+class KNNFill:
+    """
+    Fast transform for a fitted sklearn KNNImputer (NaN missing values)
+    """
+
+    def __init__(self, imputer):
+        """
+        Args:
+            imputer: Fitted sklearn.impute.KNNImputer
+        """
+        if imputer.weights not in ("uniform", "distance") or imputer.metric != "nan_euclidean":
+            raise ValueError("KNNFill supports uniform/distance weights with the nan_euclidean metric")
+
+        fit_X = np.array(imputer._fit_X, dtype=np.float64)
+        mask_fit_X = np.isnan(fit_X)
+        # sklearn drops (or zero-fills) all-NaN training columns, which this replay doesn't mirror
+        if mask_fit_X.all(axis=0).any():
+            raise ValueError("KNNFill does not support imputers fit with all-NaN columns")
+        fit_X[mask_fit_X] = 0
+
+        self.n_neighbors = imputer.n_neighbors
+        self.distance_weights = imputer.weights == "distance"
+        self.n_features = fit_X.shape[1]
+
+        # Training-side terms of sklearn's nan_euclidean_distances
+        self.fit_X_T = np.ascontiguousarray(fit_X.T)
+        self.fit_norms = np.einsum("ij,ij->i", fit_X, fit_X)
+        self.fit_sq_T = np.ascontiguousarray((fit_X * fit_X).T)
+        self.missing_T = np.ascontiguousarray(mask_fit_X.T)
+        self.present_T = np.ascontiguousarray((~mask_fit_X).T)
+
+        # Per column: donors (training rows observed there), their values and the fallback mean
+        self.donors = [np.flatnonzero(~mask_fit_X[:, c]) for c in range(self.n_features)]
+        self.donor_values = [fit_X[d, c] for c, d in enumerate(self.donors)]
+        self.col_means = np.array([v.mean() for v in self.donor_values])
+
+    def _distances(self, X: np.ndarray) -> np.ndarray:
+        missing = np.isnan(X)
+        X = np.where(missing, 0.0, X)
+
+        distances = -2 * np.dot(X, self.fit_X_T)
+        distances += np.einsum("ij,ij->i", X, X)[:, np.newaxis]
+        distances += self.fit_norms[np.newaxis, :]
+        np.maximum(distances, 0, out=distances)
+
+        distances -= np.dot(X * X, self.missing_T)
+        distances -= np.dot(missing, self.fit_sq_T)
+        np.clip(distances, 0, None, out=distances)
+
+        present_count = np.dot(1 - missing, self.present_T)
+        distances[present_count == 0] = np.nan
+        np.maximum(1, present_count, out=present_count)
+        distances /= present_count
+        distances *= self.n_features
+        return np.sqrt(distances, out=distances)
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Imputed copy of X, shape (n_samples, n_features)
+        """
+        X = np.array(X, dtype=np.float64)
+        mask = np.isnan(X)
+        rows = np.flatnonzero(mask.any(axis=1))
+        if rows.size == 0:
+            return X
+
+        dist = self._distances(X[rows])
+        for col in np.flatnonzero(mask[rows].any(axis=0)):
+            receivers = np.flatnonzero(mask[rows, col])
+            donors = self.donors[col]
+            dist_subset = dist[receivers][:, donors]
+
+            all_nan = np.isnan(dist_subset).all(axis=1)
+            X[rows[receivers[all_nan]], col] = self.col_means[col]
+            if all_nan.all():
+                continue
+            receivers = receivers[~all_nan]
+            dist_subset = dist_subset[~all_nan]
+
+            n_neighbors = min(self.n_neighbors, donors.size)
+            donors_idx = np.argpartition(dist_subset, n_neighbors - 1, axis=1)[:, :n_neighbors]
+            donors_dist = np.take_along_axis(dist_subset, donors_idx, axis=1)
+
+            if self.distance_weights:
+                with np.errstate(divide="ignore"):
+                    weights = 1.0 / donors_dist
+                inf_mask = np.isinf(weights)
+                inf_row = inf_mask.any(axis=1)
+                weights[inf_row] = inf_mask[inf_row]
+                weights[np.isnan(weights)] = 0.0
+            else:
+                weights = np.ones_like(donors_dist)
+                weights[np.isnan(donors_dist)] = 0.0
+
+            donor_values = self.donor_values[col].take(donors_idx)
+            X[rows[receivers], col] = (donor_values * weights).sum(axis=1) / weights.sum(axis=1)
+        return X
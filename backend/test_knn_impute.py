@@ -0,0 +1,72 @@
+"""
+Check script for the NumPy KNNImputer replay
+Compares KNNFill against the shipped imputer's own transform
+"""
+import sys
+from pathlib import Path
+
+import joblib
+import numpy as np
+from sklearn.impute import KNNImputer
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from knn_impute import KNNFill
+
+MODEL_DIR = Path(__file__).parent / "models"
+
+
+def _masked_rows(imputer, n_rows: int = 500, seed: int = 0) -> np.ndarray:
+    """
+    Random scaled-space rows with random missing cells, plus an all-NaN row
+    (no observed feature, so every cell falls back to the column mean).
+    """
+    rng = np.random.default_rng(seed)
+    n_features = imputer._fit_X.shape[1]
+    X = rng.normal(size=(n_rows, n_features))
+    X[rng.random(X.shape) < rng.uniform(0.05, 0.6, size=(n_rows, 1))] = np.nan
+    return np.vstack([X, np.full((1, n_features), np.nan)])
+
+
+def test_knn_impute(tolerance: float = 1e-9):
+    """Test KNNFill.transform against loaded_imputer.transform"""
+    print("Testing KNNFill...")
+    print("=" * 60)
+
+    imputer = joblib.load(MODEL_DIR / "RF_imputer_allCVD.pkl")
+    print("✓ Imputer loaded")
+
+    X = _masked_rows(imputer)
+    print(f"  Rows: {X.shape[0]}, missing cells: {int(np.isnan(X).sum())}")
+
+    diff = np.abs(KNNFill(imputer).transform(X) - imputer.transform(X)).max()
+    print(f"  Max imputation difference: {diff:.3e}")
+
+    # Uniform weights take a different branch than the shipped (distance) imputer
+    train = np.array(imputer._fit_X, dtype=np.float64)
+    other = KNNImputer(n_neighbors=imputer.n_neighbors,
+                       weights="uniform" if imputer.weights == "distance" else "distance").fit(train)
+    other_diff = np.abs(KNNFill(other).transform(X) - other.transform(X)).max()
+    print(f"  Max imputation difference ({other.weights} weights): {other_diff:.3e}")
+
+    # sklearn drops all-NaN training columns; KNNFill must refuse such imputers
+    train[:, 0] = np.nan
+    try:
+        KNNFill(KNNImputer().fit(train))
+        rejected = False
+    except ValueError:
+        rejected = True
+    print(f"  All-NaN training column rejected: {rejected}")
+
+    print("\n" + "=" * 60)
+    assert max(diff, other_diff) <= tolerance, "KNNFill disagrees with KNNImputer.transform"
+    assert rejected, "KNNFill accepted an imputer with an all-NaN training column"
+    print("✓ KNNFill test complete!")
+
+
+if __name__ == "__main__":
+    try:
+        test_knn_impute()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
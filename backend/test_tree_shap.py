@@ -0,0 +1,74 @@
+"""
+Check script for the Numba TreeSHAP kernels
+Compares ForestShap against the shipped shap explainer on realistic rows
+"""
+import sys
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from tree_shap import ForestShap
+from knn_impute import KNNFill
+
+MODEL_DIR = Path(__file__).parent / "models"
+N_FEATURES = 21
+
+
+def _realistic_rows(imputer, scaler) -> np.ndarray:
+    """
+    The imputer's training rows in original units, rounded to 0.1 like form
+    input, so many of them sit right on the forest's split thresholds.
+    """
+    raw = np.asarray(imputer._fit_X, dtype=np.float64) * scaler.scale_ + scaler.mean_
+    raw = np.round(raw, 1)
+    # A sparse form-like request: everything but a few vitals missing
+    form_row = np.full(N_FEATURES, np.nan)
+    form_row[[0, 1, 4, 7, 17]] = [60.0, 7.1, 27.0, 130.0, 1.0]
+    return np.vstack([raw, form_row])
+
+
+def test_tree_shap(tolerance: float = 1e-9):
+    """Test ForestShap against loaded_explainer.shap_values / model.predict"""
+    print("Testing ForestShap...")
+    print("=" * 60)
+
+    explainer = joblib.load(MODEL_DIR / "RF_explainer_allCVD.z")
+    imputer = joblib.load(MODEL_DIR / "RF_imputer_allCVD.pkl")
+    scaler = joblib.load(MODEL_DIR / "RF_scaler_allCVD.pkl")
+    print("✓ Models loaded")
+
+    # Same order as the backend: scale, then impute in scaled space
+    raw = _realistic_rows(imputer, scaler)
+    scaled = KNNFill(imputer).transform((raw - scaler.mean_) / scaler.scale_)
+    print(f"  Rows: {scaled.shape[0]}")
+
+    forest_shap = ForestShap(explainer, n_features=N_FEATURES)
+
+    expected_shap = explainer.shap_values(scaled, check_additivity=False)
+    expected_shap = expected_shap[1] if isinstance(expected_shap, list) else expected_shap[..., 1]
+    expected_prob = explainer.model.predict(scaled)[:, 1]
+
+    shap_diff = np.abs(forest_shap.shap_values(scaled) - expected_shap).max()
+    prob_diff = np.abs(forest_shap.predict(scaled) - expected_prob).max()
+    print(f"  Max SHAP difference: {shap_diff:.3e}")
+    print(f"  Max probability difference: {prob_diff:.3e}")
+
+    # Saabas attributions differ from TreeSHAP, but must still add up to the prediction
+    approx = forest_shap.shap_values(scaled, approximate=True)
+    approx_diff = np.abs(forest_shap.base_value + approx.sum(axis=1) - expected_prob).max()
+    print(f"  Max approximate additivity error: {approx_diff:.3e}")
+
+    print("\n" + "=" * 60)
+    assert max(shap_diff, prob_diff, approx_diff) <= tolerance, "ForestShap disagrees with the explainer"
+    print("✓ ForestShap test complete!")
+
+
+if __name__ == "__main__":
+    try:
+        test_tree_shap()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
@@ -0,0 +1,337 @@
+"""
+Numba-compiled TreeSHAP for the fixed 21-feature random forest explainer.
+
+The pickled SHAP explainer already holds the forest as padded 2D arrays
+(one row per tree), so the kernels below walk those buffers directly
+instead of going through shap's per-call Python dispatch. The request-row
+scaling kernel lives here too, so every per-request loop is compiled.
+"""
+import numpy as np
+from numba import njit, prange, get_num_threads
+
+# fastmath without 'nnan'/'ninf' so the isnan() default-direction check survives
+FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def scale_rows(X, scale_inv, scale_bias, out):
+    """
+    Fused StandardScaler (x * scale_inv + scale_bias) into out; NaNs pass through.
+
+    Returns:
+        True if any input value is NaN (the row then still needs imputation)
+    """
+    has_nan = False
+    for s in range(X.shape[0]):
+        for j in range(X.shape[1]):
+            v = X[s, j]
+            if np.isnan(v):
+                has_nan = True
+            out[s, j] = v * scale_inv[j] + scale_bias[j]
+    return has_nan
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _extend_path(feat, zero, one, pw, level, unique_depth, zero_fraction, one_fraction, feature_index):
+    feat[level, unique_depth] = feature_index
+    zero[level, unique_depth] = zero_fraction
+    one[level, unique_depth] = one_fraction
+    pw[level, unique_depth] = 1.0 if unique_depth == 0 else 0.0
+    for i in range(unique_depth - 1, -1, -1):
+        pw[level, i + 1] += one_fraction * pw[level, i] * (i + 1) / (unique_depth + 1)
+        pw[level, i] = zero_fraction * pw[level, i] * (unique_depth - i) / (unique_depth + 1)
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _unwind_path(feat, zero, one, pw, level, unique_depth, path_index):
+    one_fraction = one[level, path_index]
+    zero_fraction = zero[level, path_index]
+    next_one_portion = pw[level, unique_depth]
+    for i in range(unique_depth - 1, -1, -1):
+        if one_fraction != 0.0:
+            tmp = pw[level, i]
+            pw[level, i] = next_one_portion * (unique_depth + 1) / ((i + 1) * one_fraction)
+            next_one_portion = tmp - pw[level, i] * zero_fraction * (unique_depth - i) / (unique_depth + 1)
+        else:
+            pw[level, i] = pw[level, i] * (unique_depth + 1) / (zero_fraction * (unique_depth - i))
+    for i in range(path_index, unique_depth):
+        feat[level, i] = feat[level, i + 1]
+        zero[level, i] = zero[level, i + 1]
+        one[level, i] = one[level, i + 1]
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _unwound_path_sum(zero, one, pw, level, unique_depth, path_index):
+    one_fraction = one[level, path_index]
+    zero_fraction = zero[level, path_index]
+    next_one_portion = pw[level, unique_depth]
+    total = 0.0
+    for i in range(unique_depth - 1, -1, -1):
+        if one_fraction != 0.0:
+            tmp = next_one_portion * (unique_depth + 1) / ((i + 1) * one_fraction)
+            total += tmp
+            next_one_portion = pw[level, i] - tmp * zero_fraction * (unique_depth - i) / (unique_depth + 1)
+        else:
+            total += (pw[level, i] / zero_fraction) / ((unique_depth - i) / (unique_depth + 1))
+    return total
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _tree_shap(x, phi, t, left, right, default, features, thresholds, values, weights,
+               feat, zero, one, pw, stack_node, stack_level, stack_depth, stack_feat,
+               stack_zero, stack_one):
+    """
+    Path-dependent TreeSHAP for tree t and one row, accumulated into phi.
+
+    The recursion of Lundberg et al. is unrolled onto an explicit stack;
+    each recursion level keeps its own copy of the unique path in the
+    (max_depth + 2)-square work buffers.
+    """
+    stack_node[0] = 0
+    stack_level[0] = 0
+    stack_depth[0] = 0
+    stack_feat[0] = -1
+    stack_zero[0] = 1.0
+    stack_one[0] = 1.0
+    top = 1
+
+    while top > 0:
+        top -= 1
+        node = stack_node[top]
+        level = stack_level[top]
+        unique_depth = stack_depth[top]
+
+        if level > 0:
+            for i in range(unique_depth):
+                feat[level, i] = feat[level - 1, i]
+                zero[level, i] = zero[level - 1, i]
+                one[level, i] = one[level - 1, i]
+                pw[level, i] = pw[level - 1, i]
+        _extend_path(feat, zero, one, pw, level, unique_depth,
+                     stack_zero[top], stack_one[top], stack_feat[top])
+
+        if left[t, node] < 0:
+            leaf_value = values[t, node]
+            for i in range(1, unique_depth + 1):
+                w = _unwound_path_sum(zero, one, pw, level, unique_depth, i)
+                phi[feat[level, i]] += w * (one[level, i] - zero[level, i]) * leaf_value
+            continue
+
+        split = features[t, node]
+        xv = x[split]
+        if np.isnan(xv):
+            hot = default[t, node]
+        elif xv <= thresholds[t, node]:
+            hot = left[t, node]
+        else:
+            hot = right[t, node]
+        cold = right[t, node] if hot == left[t, node] else left[t, node]
+
+        w = weights[t, node]
+        hot_zero_fraction = weights[t, hot] / w
+        cold_zero_fraction = weights[t, cold] / w
+        incoming_zero_fraction = 1.0
+        incoming_one_fraction = 1.0
+
+        # If we already split on this feature, undo that split so it counts once
+        path_index = 0
+        while path_index <= unique_depth:
+            if feat[level, path_index] == split:
+                break
+            path_index += 1
+        if path_index != unique_depth + 1:
+            incoming_zero_fraction = zero[level, path_index]
+            incoming_one_fraction = one[level, path_index]
+            _unwind_path(feat, zero, one, pw, level, unique_depth, path_index)
+            unique_depth -= 1
+
+        # Cold is pushed first so the hot branch is walked first
+        stack_node[top] = cold
+        stack_level[top] = level + 1
+        stack_depth[top] = unique_depth + 1
+        stack_feat[top] = split
+        stack_zero[top] = cold_zero_fraction * incoming_zero_fraction
+        stack_one[top] = 0.0
+        top += 1
+        stack_node[top] = hot
+        stack_level[top] = level + 1
+        stack_depth[top] = unique_depth + 1
+        stack_feat[top] = split
+        stack_zero[top] = hot_zero_fraction * incoming_zero_fraction
+        stack_one[top] = incoming_one_fraction
+        top += 1
+
+
+@njit(parallel=True, cache=True, fastmath=FASTMATH)
+def tree_shap_batch(X, left, right, default, features, thresholds, values, weights, max_depth,
+                    n_chunks, out):
+    """
+    SHAP values of one model output for every row of X.
+
+    Trees are independent, so they are split into one chunk per Numba
+    thread; each chunk owns its work buffers and a partial SHAP matrix,
+    and the partials are reduced after the parallel loop.
+
+    Args:
+        X: (n_samples, n_features) float64 matrix in model (scaled) space
+        left, right, default, features: (n_trees, max_nodes) int64 node arrays
+        thresholds, values, weights: (n_trees, max_nodes) float64 node arrays
+        max_depth: Deepest tree in the forest
+        n_chunks: Number of tree chunks (normally the Numba thread count)
+        out: (n_samples, n_features) float64 buffer the result is written into
+
+    Returns:
+        out, holding the SHAP matrix
+    """
+    n_samples, n_features = X.shape
+    n_trees = left.shape[0]
+    n_chunks = min(n_chunks, n_trees)
+    partial = np.zeros((n_chunks, n_samples, n_features))
+    n_levels = max_depth + 2
+
+    for c in prange(n_chunks):
+        feat = np.empty((n_levels, n_levels), dtype=np.int64)
+        zero = np.empty((n_levels, n_levels))
+        one = np.empty((n_levels, n_levels))
+        pw = np.empty((n_levels, n_levels))
+        # Stack frame: node, level, unique_depth, feature_index, zero_fraction, one_fraction
+        stack_node = np.empty(2 * n_levels, dtype=np.int64)
+        stack_level = np.empty(2 * n_levels, dtype=np.int64)
+        stack_depth = np.empty(2 * n_levels, dtype=np.int64)
+        stack_feat = np.empty(2 * n_levels, dtype=np.int64)
+        stack_zero = np.empty(2 * n_levels)
+        stack_one = np.empty(2 * n_levels)
+
+        for s in range(n_samples):
+            x = X[s]
+            row_phi = partial[c, s]
+            for t in range(c, n_trees, n_chunks):
+                _tree_shap(x, row_phi, t, left, right, default, features, thresholds, values, weights,
+                           feat, zero, one, pw, stack_node, stack_level, stack_depth,
+                           stack_feat, stack_zero, stack_one)
+
+    out[:, :] = partial[0]
+    for c in range(1, n_chunks):
+        out += partial[c]
+    return out
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def saabas_batch(X, left, right, default, features, thresholds, values, out):
+    """
+    Approximate (Saabas) attributions for every row of X.
+
+    Each split on the decision path credits its feature with the change in
+    the node's expected output, so a row costs O(depth) per tree instead of
+    TreeSHAP's O(depth^2). Still additive: base_value + row sum == prediction.
+    """
+    out[:, :] = 0.0
+    for s in range(X.shape[0]):
+        for t in range(left.shape[0]):
+            node = 0
+            while left[t, node] >= 0:
+                split = features[t, node]
+                xv = X[s, split]
+                if np.isnan(xv):
+                    child = default[t, node]
+                elif xv <= thresholds[t, node]:
+                    child = left[t, node]
+                else:
+                    child = right[t, node]
+                out[s, split] += values[t, child] - values[t, node]
+                node = child
+    return out
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def predict_batch(X, left, right, default, features, thresholds, values):
+    """
+    Forest output for every row of X (sum of the reached leaf values).
+    """
+    n_samples = X.shape[0]
+    out = np.zeros(n_samples)
+    for s in range(n_samples):
+        total = 0.0
+        for t in range(left.shape[0]):
+            node = 0
+            while left[t, node] >= 0:
+                xv = X[s, features[t, node]]
+                if np.isnan(xv):
+                    node = default[t, node]
+                elif xv <= thresholds[t, node]:
+                    node = left[t, node]
+                else:
+                    node = right[t, node]
+            total += values[t, node]
+        out[s] = total
+    return out
+
+
+class ForestShap:
+    """
+    Fast SHAP/probability evaluator built from a loaded shap.TreeExplainer
+    """
+
+    def __init__(self, explainer, n_features: int, output: int = 1):
+        """
+        Args:
+            explainer: shap.TreeExplainer wrapping the random forest
+            n_features: Number of model input features
+            output: Model output (class) to explain
+        """
+        model = explainer.model
+        self.left = np.ascontiguousarray(model.children_left, dtype=np.int64)
+        self.right = np.ascontiguousarray(model.children_right, dtype=np.int64)
+        self.default = np.ascontiguousarray(model.children_default, dtype=np.int64)
+        self.features = np.ascontiguousarray(model.features, dtype=np.int64)
+        self.thresholds = np.ascontiguousarray(model.thresholds, dtype=np.float64)
+        self.values = np.ascontiguousarray(model.values[:, :, output], dtype=np.float64)
+        self.weights = np.ascontiguousarray(model.node_sample_weight, dtype=np.float64)
+        self.max_depth = int(model.max_depth)
+        self.n_features = n_features
+        self.base_value = float(explainer.expected_value[output])
+
+    @staticmethod
+    def _as_model_input(X: np.ndarray) -> np.ndarray:
+        """
+        Rows rounded to float32 (then widened back for the kernels).
+        sklearn's forest and shap's TreeEnsemble (input_dtype float32) both
+        compare float32 inputs against the thresholds; comparing the float64
+        rows instead sends values just around a split down the other branch.
+        """
+        return np.asarray(X, dtype=np.float32).astype(np.float64)
+
+    def shap_values(self, X: np.ndarray, approximate: bool = False) -> np.ndarray:
+        """
+        SHAP values for each row of X, shape (n_samples, n_features)
+
+        Args:
+            X: Rows in model (scaled) space
+            approximate: Use path (Saabas) attributions instead of exact TreeSHAP
+        """
+        X = self._as_model_input(X)
+        # Fresh per call: cached predictions keep views into the result
+        out = np.empty((X.shape[0], self.n_features))
+        if approximate:
+            return saabas_batch(X, self.left, self.right, self.default, self.features,
+                                self.thresholds, self.values, out)
+        return tree_shap_batch(X, self.left, self.right, self.default, self.features,
+                               self.thresholds, self.values, self.weights, self.max_depth,
+                               get_num_threads(), out)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Forest probability for each row of X, without computing SHAP values
+        """
+        X = self._as_model_input(X)
+        return predict_batch(X, self.left, self.right, self.default, self.features,
+                             self.thresholds, self.values)
+
+    def warmup(self):
+        """
+        Trigger JIT compilation with a dummy row so requests never pay for it
+        """
+        dummy = np.zeros((1, self.n_features))
+        self.shap_values(dummy)
+        self.shap_values(dummy, approximate=True)
+        self.predict(dummy)
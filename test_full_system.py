@@ -1,19 +1,26 @@
 import sys
 import os
-from dotenv import load_dotenv
+import asyncio
+import hashlib
+import shutil
+from pathlib import Path
 
 # --- 1. Environment Variable Yükleme (EN ÖNEMLİ KISIM) ---
 # Script root'ta çalışıyor, .env dosyası muhtemelen 'backend/.env' içinde.
+# Anahtar zaten ortamda varsa dotenv'e hiç gerek yok.
 current_dir = os.path.dirname(os.path.abspath(__file__))
 backend_env_path = os.path.join(current_dir, 'backend', '.env')
 
-if os.path.exists(backend_env_path):
-    print(f"✅ .env dosyası bulundu: {backend_env_path}")
-    load_dotenv(backend_env_path)
-else:
-    # Belki root dizindedir, onu deneyelim
-    print("ℹ️  backend/.env bulunamadı, ana dizindeki .env deneniyor...")
-    load_dotenv()
+if not os.getenv("OPENAI_API_KEY"):
+    from dotenv import load_dotenv
+
+    if os.path.exists(backend_env_path):
+        print(f"✅ .env dosyası bulundu: {backend_env_path}")
+        load_dotenv(backend_env_path)
+    else:
+        # Belki root dizindedir, onu deneyelim
+        print("ℹ️  backend/.env bulunamadı, ana dizindeki .env deneniyor...")
+        load_dotenv()
 
 # Kontrol edelim
 if not os.getenv("OPENAI_API_KEY"):
@@ -26,58 +33,85 @@ if not os.getenv("OPENAI_API_KEY"):
 # backend klasörünü Python yoluna ekle
 sys.path.append(os.path.join(current_dir, 'backend'))
 
-# --- 3. Agent Import ---
-try:
-    from backend.XAIagent_code.agents.knowledge_agent import KnowledgeAgent
-except ImportError as e:
-    # Alternatif import yolu (bazı IDE yapılandırmaları için)
-    sys.path.append(current_dir)
-    from backend.XAIagent_code.knowledge_agent import KnowledgeAgent
+# --- 3. Cevap Cache'i ---
+# Aynı soru tekrar sorulduğunda OpenAI/PubMed/RAG'e gitmeden diskten dön.
+# FRESH=1 ile cache silinir ve cevaplar yeniden üretilir.
+ANSWER_CACHE_DIR = Path(current_dir) / ".cache" / "answers"
+
+if os.getenv("FRESH") == "1":
+    shutil.rmtree(ANSWER_CACHE_DIR, ignore_errors=True)
+
+def cached_answer(agent, question):
+    path = ANSWER_CACHE_DIR / f"{hashlib.sha1(question.encode()).hexdigest()}.txt"
+    if path.exists():
+        return path.read_text(encoding="utf-8")
+
+    answer = agent.answer_question(question)
+    # Hata mesajlarını cache'leme
+    if not answer.startswith("Error"):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(answer, encoding="utf-8")
+    return answer
 
-def test_system():
+async def test_system():
     print("\n🤖 Başlatılıyor: Knowledge Agent...")
     try:
+        # Ağır import (openai, chromadb, PDF kütüphaneleri) ancak API anahtarı kontrolünden sonra
+        try:
+            from backend.XAIagent_code.agents.knowledge_agent import KnowledgeAgent
+        except ImportError:
+            # Alternatif import yolu (bazı IDE yapılandırmaları için)
+            sys.path.append(current_dir)
+            from backend.XAIagent_code.knowledge_agent import KnowledgeAgent
+
         agent = KnowledgeAgent()
         print("✅ Agent başarıyla başlatıldı.")
     except Exception as e:
         print(f"❌ Başlatma Hatası: {e}")
         return
 
+    q1 = "Does Dasatinib increase cardiovascular risk?"
+    q2 = "What do the guidelines say about initial assessment for CML?"
+
+    # İki soru da OpenAI + PubMed/RAG I/O'sunu bekliyor: thread'lerde aynı anda sor
+    print(f"\nSorular paralel soruluyor:\n  1) {q1}\n  2) {q2}\n...")
+    ans1, ans2 = await asyncio.gather(
+        asyncio.to_thread(cached_answer, agent, q1),
+        asyncio.to_thread(cached_answer, agent, q2),
+        return_exceptions=True
+    )
+
     # TEST 1: PubMed
     print("\n------------------------------------------------")
     print("🔬 TEST 1: PubMed Entegrasyonu (Dasatinib & Kalp)")
     print("------------------------------------------------")
-    q1 = "Does Dasatinib increase cardiovascular risk?"
-    print(f"Soru Soruluyor: {q1} ...")
-    
-    try:
-        ans1 = agent.answer_question(q1)
+    print(f"Soru: {q1}")
+
+    if isinstance(ans1, Exception):
+        print(f"❌ PubMed Test Hatası: {ans1}")
+    else:
         print(f"\nCEVAP:\n{ans1[:500]}...\n(Devamı kesildi)")
-        
+
         if "PubMed" in ans1 or "Article" in ans1 or "Ref" in ans1 or "Dasatinib" in ans1:
             print("\n✅ BAŞARILI: Mantıklı bir cevap döndü.")
         else:
             print("\n⚠️ UYARI: Cevap döndü ama kaynak belirtilmemiş olabilir.")
-    except Exception as e:
-        print(f"❌ PubMed Test Hatası: {e}")
 
     # TEST 2: PDF (RAG)
     print("\n------------------------------------------------")
     print("📄 TEST 2: PDF RAG Entegrasyonu (Kılavuzlar)")
     print("------------------------------------------------")
-    q2 = "What do the guidelines say about initial assessment for CML?"
-    print(f"Soru Soruluyor: {q2} ...")
-    
-    try:
-        ans2 = agent.answer_question(q2)
+    print(f"Soru: {q2}")
+
+    if isinstance(ans2, Exception):
+        print(f"❌ RAG Test Hatası: {ans2}")
+    else:
         print(f"\nCEVAP:\n{ans2[:500]}...\n(Devamı kesildi)")
-        
+
         if "Guideline" in ans2 or "Source" in ans2 or "recommend" in ans2.lower():
             print("\n✅ BAŞARILI: PDF/Kılavuz bazlı cevap döndü.")
         else:
             print("\n⚠️ UYARI: Cevap döndü ama PDF kaynağı net değil.")
-    except Exception as e:
-        print(f"❌ RAG Test Hatası: {e}")
 
 if __name__ == "__main__":
-    test_system()
\ No newline at end of file
+    asyncio.run(test_system())
\ No newline at end of file